@@ -7,7 +7,7 @@ if __name__ == "__main__":
         enable=7,
         sda=4,
         scl=5,
-        i2c_frequency=100000,
+        i2c_frequency=400000,
         debug=True,
         wdt=machine.WDT(timeout=8000),
     )
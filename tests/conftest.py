@@ -4,7 +4,7 @@ import sys
 
 import pytest
 
-from tests import machine_mock, utime_mock
+from tests import machine_mock, uasyncio_mock, utime_mock
 
 # Mocks the micropython machine module
 sys.modules["machine"] = machine_mock
@@ -12,9 +12,23 @@ sys.modules["machine"] = machine_mock
 # Mocks the utime module
 sys.modules["utime"] = utime_mock
 
+# Mocks the uasyncio module
+sys.modules["uasyncio"] = uasyncio_mock
+
 from tmf8805.tmf8805 import TMF8805  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_configuration():
+    """Fixture that resets the mocked sensor to a correct measurement before each test
+    and drops the IRQ handlers of instances from previous tests"""
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.CORRECT_MEASUREMENT
+    )
+    machine_mock.IRQ_HANDLERS.clear()
+
+
 @pytest.fixture
 def tmf8805_instance() -> TMF8805:
     """Fixture for a tmf8805 instance
@@ -28,3 +42,18 @@ def tmf8805_instance() -> TMF8805:
     )
 
     return tmf8805
+
+
+@pytest.fixture
+def tmf8805_instance_with_int_pin() -> TMF8805:
+    """Fixture for a tmf8805 instance with the INT line wired to a GPIO
+
+    Returns:
+        TMF8805: The object of a tmf8805 instance
+    """
+
+    tmf8805: TMF8805 = TMF8805(
+        enable=7, sda=4, scl=5, int_pin=6, debug=True, wdt=machine_mock.WDT()
+    )
+
+    return tmf8805
@@ -1,6 +1,5 @@
 """This module mocks the machine library from micropython"""
 
-import sys
 from enum import Enum
 from typing import List
 
@@ -15,18 +14,26 @@ class TMF8805MockConfiguration(Enum):
     APPLICATION_READY_TIMEOUT = 4
     UNKNOWN_STATUS = 5
     DATA_AVAILABLE_TIMEOUT = 6
+    ASYMMETRIC_RESULT_INFO = 7
 
 
 TMF8805_MOCK_CONFIGURATION: TMF8805MockConfiguration = (
     TMF8805MockConfiguration.CORRECT_MEASUREMENT
 )
 
+# Handlers registered with Pin.irq, called when the mocked sensor finished a measurement
+IRQ_HANDLERS: List = []
+
 
 class I2C:
     def __init__(self, *args, **kwargs) -> None:
         """Mocks the constructor of the I2C class"""
 
-        pass
+        # Transactions as (memaddr, nbytes) for reads and (memaddr, data) for writes
+        self.reads: List = []
+        self.writes: List = []
+        # Count of reads that returned a newly allocated bytes object
+        self.allocating_reads: int = 0
 
     def scan(self) -> List:
         if TMF8805_MOCK_CONFIGURATION == TMF8805MockConfiguration.NOT_CONNECTED:
@@ -35,79 +42,113 @@ class I2C:
         return [65]
 
     def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8) -> bytes:
+        self.reads.append((memaddr, nbytes))
+        self.allocating_reads += 1
+
+        return self._register_content(memaddr, nbytes)
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8) -> None:
+        self.reads.append((memaddr, len(buf)))
+        buf[:] = self._register_content(memaddr, len(buf))
+
+    def _register_content(self, memaddr, nbytes) -> bytes:
         if memaddr == 0:  # REGISTER_APPID
             if (
                 TMF8805_MOCK_CONFIGURATION
                 == TMF8805MockConfiguration.APPLICATION_READY_TIMEOUT
             ):
-                return int(0).to_bytes(2, sys.byteorder)
+                return bytes([0])
 
-            return int(192).to_bytes(2, sys.byteorder)
+            return bytes([192])
 
         if memaddr == 14:  # REGISTER_ENABLE_REG
-            return int(1).to_bytes(2, sys.byteorder)
+            return bytes([1])
 
         if memaddr == 29:  # REGISTER_STATUS
             if TMF8805_MOCK_CONFIGURATION == TMF8805MockConfiguration.UNKNOWN_STATUS:
-                return int(9999).to_bytes(
-                    2, sys.byteorder
-                )  # Status that is not implemented
+                return bytes([99])  # Status that is not implemented
 
-            return int(39).to_bytes(2, sys.byteorder)  # MISSING_FACTORY_CALIBRATION
+            return bytes([39])  # MISSING_FACTORY_CALIBRATION
 
         if memaddr == 30:  # REGISTER_REGISTER_CONTENTS
             if (
                 TMF8805_MOCK_CONFIGURATION
                 == TMF8805MockConfiguration.PERFORM_CALIBRATION
             ):
-                return int(10).to_bytes(2, sys.byteorder)
+                return bytes([10])
 
             if (
                 TMF8805_MOCK_CONFIGURATION
                 == TMF8805MockConfiguration.DATA_AVAILABLE_TIMEOUT
             ):
-                return int(0).to_bytes(2, sys.byteorder)
+                return bytes([0])
 
-            return int(85).to_bytes(2, sys.byteorder)
+            return bytes([85])
 
         if memaddr == 32:  # REGISTER_FACTORY_CALIB_0
             return ("A" * nbytes).encode()
 
         if memaddr == 33:  # REGISTER_RESULT_INFO
-            return int(63).to_bytes(2, sys.byteorder)  # Reliability = 63, Status = 0
+            if nbytes == 3:  # Burst read till REGISTER_DISTANCE_PEAK_1
+                if (
+                    TMF8805_MOCK_CONFIGURATION
+                    == TMF8805MockConfiguration.ASYMMETRIC_RESULT_INFO
+                ):
+                    return bytes([0b10000101, 226, 4])  # Reliability = 5, Status = 2
+
+                return bytes([63, 226, 4])
+
+            return bytes([63])  # Reliability = 63, Status = 0
 
         if memaddr == 34:  # REGISTER_DISTANCE_PEAK_0
-            return int(226).to_bytes(2, sys.byteorder)
+            return bytes([226])
 
         if memaddr == 35:  # REGISTER_DISTANCE_PEAK_1
-            return int(4).to_bytes(2, sys.byteorder)
+            return bytes([4])
 
         if memaddr == 224:  # REGISTER_ENABLE_REG
             if TMF8805_MOCK_CONFIGURATION == TMF8805MockConfiguration.CPU_READY_TIMEOUT:
-                return int(0).to_bytes(2, sys.byteorder)
+                return bytes([0])
 
-            return int(64).to_bytes(2, sys.byteorder)
+            return bytes([64])
 
         if memaddr == 225:  # REGISTER_INT_STATUS
-            return int(1).to_bytes(2, sys.byteorder)
+            return bytes([1])
 
         pass
 
     def writeto_mem(self, addr, memaddr, buf, *, addrsize=8) -> None:
+        self.writes.append((memaddr, bytes(buf)))
 
-        pass
+        if memaddr == 16 and buf[0] == 2:  # REGISTER_COMMAND, COMMAND_MEASURE
+            if (
+                TMF8805_MOCK_CONFIGURATION
+                == TMF8805MockConfiguration.DATA_AVAILABLE_TIMEOUT
+            ):
+                return
+
+            for handler in IRQ_HANDLERS:
+                handler(None)
 
 
 class Pin:
     """Mocks the micropython Pin class"""
 
+    IN: int = 0
     OUT: int = 1
+    PULL_UP: int = 1
+    IRQ_FALLING: int = 4
 
     def __init__(self, *args, **kwargs) -> None:
         """Mocks the constructor of the Pin class"""
 
         pass
 
+    def irq(self, trigger: int, handler) -> None:
+        """Mocks the irq function of the Pin class"""
+
+        IRQ_HANDLERS.append(handler)
+
     def high(self) -> None:
         """Mocks the high function of the Pin class"""
 
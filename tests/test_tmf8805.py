@@ -1,7 +1,7 @@
 """Module to test the implementation for the tmf8805 sensor"""
 
-from tests import machine_mock
-from tmf8805.tmf8805 import TMF8805
+from tests import machine_mock, uasyncio_mock, utime_mock
+from tmf8805.tmf8805 import ALGO_STATE_BYTES, CPU_READY_TIMEOUT_MS, TMF8805
 
 
 def test_initialization_of_tmf8805(tmf8805_instance: TMF8805):
@@ -19,6 +19,35 @@ def test_connected_check(tmf8805_instance: TMF8805):
     assert not tmf8805_instance.is_connected()
 
 
+def test_rescan_of_connection(tmf8805_instance: TMF8805):
+    """Test if the connection check is cached till the bus is scanned again"""
+
+    assert tmf8805_instance.is_connected()
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.NOT_CONNECTED
+    )
+    assert tmf8805_instance.is_connected()
+    assert not tmf8805_instance.rescan()
+    assert not tmf8805_instance.is_connected()
+
+
+def test_sensor_found_after_missed_scan(tmf8805_instance: TMF8805):
+    """Test if a sensor that was missing on the first scan is found later on"""
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.NOT_CONNECTED
+    )
+    assert not tmf8805_instance.is_connected()
+    assert not tmf8805_instance.initialize()
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.CORRECT_MEASUREMENT
+    )
+    assert tmf8805_instance.is_connected()
+    assert tmf8805_instance.initialize()
+
+
 def test_execution_of_measurement(tmf8805_instance: TMF8805):
     """Test if the performing of a measurement is working"""
 
@@ -27,6 +56,27 @@ def test_execution_of_measurement(tmf8805_instance: TMF8805):
     assert distance == 1250
 
 
+def test_decoding_of_result_info(tmf8805_instance: TMF8805, capsys):
+    """Test if reliability and status are decoded from bits 5:0 and 7:6 of RESULT_INFO"""
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.ASYMMETRIC_RESULT_INFO
+    )
+
+    assert tmf8805_instance.initialize()
+    assert tmf8805_instance.get_measurement() == 1250
+    assert "(Reliabilty: 5; Status: 2;" in capsys.readouterr().out
+
+
+def test_measurement_reads_into_scratch_buffers(tmf8805_instance: TMF8805):
+    """Test if initialization and measurement only read into preallocated buffers"""
+
+    assert tmf8805_instance.initialize()
+    assert tmf8805_instance.get_measurement() == 1250
+    assert tmf8805_instance.i2c.reads
+    assert tmf8805_instance.i2c.allocating_reads == 0
+
+
 def test_performing_of_calibration(tmf8805_instance: TMF8805):
     """Test if the methods for get, set and perform a calibration are working"""
 
@@ -39,7 +89,28 @@ def test_performing_of_calibration(tmf8805_instance: TMF8805):
 
     new_calibration = tmf8805_instance.perform_calibration()
     assert new_calibration.decode() == "AAAAAAAAAAAAAA"
-    tmf8805_instance.set_calibration(new_calibration)
+    assert tmf8805_instance.set_calibration(new_calibration)
+
+
+def test_setting_of_invalid_calibration(tmf8805_instance: TMF8805):
+    """Test if calibration data with a wrong length is rejected"""
+
+    assert not tmf8805_instance.set_calibration(b"")
+    assert tmf8805_instance.i2c.writes == []
+
+
+def test_setting_of_calibration_writes(tmf8805_instance: TMF8805):
+    """Test if the calibration command is followed by one burst of calibration and
+    algorithm state"""
+
+    calibration_data = bytes(range(14))
+
+    assert tmf8805_instance.set_calibration(calibration_data)
+    assert tmf8805_instance.i2c.writes == [
+        (0x10, b"\x0b"),
+        (0x20, calibration_data + ALGO_STATE_BYTES),
+    ]
+    assert len(tmf8805_instance.i2c.writes[1][1]) == 25
 
 
 def test_get_status(tmf8805_instance: TMF8805):
@@ -61,15 +132,27 @@ def test_not_implemented_status(tmf8805_instance: TMF8805):
     )
 
     error, description = tmf8805_instance.get_status()
-    assert error == "9999"
+    assert error == "99"
     assert description == "N/A"
 
 
 def test_clearing_of_the_interrupt_flag(tmf8805_instance: TMF8805):
-    """Test if the clearing of the interrupt flag returns no error"""
+    """Test if the interrupt flag is cleared with a single write-1-to-clear write"""
 
     tmf8805_instance.clear_interrupt_flag()
 
+    assert tmf8805_instance.i2c.writes == [(0xE1, b"\x01")]
+    assert tmf8805_instance.i2c.reads == []
+
+
+def test_enabling_of_the_interrupt(tmf8805_instance: TMF8805):
+    """Test if the interrupt is enabled with a single write of the result interrupt bit"""
+
+    tmf8805_instance.enable_interrupt()
+
+    assert tmf8805_instance.i2c.writes == [(0xE2, b"\x01")]
+    assert tmf8805_instance.i2c.reads == []
+
 
 def test_power_up_and_power_down(tmf8805_instance: TMF8805):
     """Test if the power up/down methods don't raise an error"""
@@ -118,3 +201,99 @@ def test_data_available_timeout(tmf8805_instance: TMF8805):
 
     assert tmf8805_instance.initialize()
     assert not tmf8805_instance.get_measurement()
+
+
+def test_cpu_ready_timeout_duration(tmf8805_instance: TMF8805):
+    """Test if waiting for the cpu to be ready gives up after the configured time"""
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.CPU_READY_TIMEOUT
+    )
+
+    start = utime_mock.ticks_ms()
+    assert not tmf8805_instance.is_cpu_ready()
+    assert utime_mock.ticks_diff(utime_mock.ticks_ms(), start) == CPU_READY_TIMEOUT_MS
+
+
+def test_measurement_with_interrupt_pin(tmf8805_instance_with_int_pin: TMF8805):
+    """Test if a measurement waits for the interrupt instead of polling over I2C"""
+
+    tmf8805 = tmf8805_instance_with_int_pin
+
+    assert tmf8805.initialize()
+    tmf8805.i2c.reads.clear()
+    assert tmf8805.get_measurement() == 1250
+    assert (0x1E, 1) not in tmf8805.i2c.reads  # REGISTER_REGISTER_CONTENTS
+
+
+def test_data_available_timeout_with_interrupt_pin(
+    tmf8805_instance_with_int_pin: TMF8805,
+):
+    """Test if a missing interrupt is handled as a timeout"""
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.DATA_AVAILABLE_TIMEOUT
+    )
+    tmf8805 = tmf8805_instance_with_int_pin
+
+    assert tmf8805.initialize()
+    tmf8805.i2c.reads.clear()
+    assert not tmf8805.get_measurement()
+    assert (0x1E, 1) not in tmf8805.i2c.reads  # REGISTER_REGISTER_CONTENTS
+
+
+def test_async_measurement_with_interrupt_pin(tmf8805_instance_with_int_pin: TMF8805):
+    """Test if the async measurement waits for the interrupt when an INT pin is given"""
+
+    tmf8805 = tmf8805_instance_with_int_pin
+
+    assert len(machine_mock.IRQ_HANDLERS) == 1
+    assert uasyncio_mock.run(tmf8805.initialize_async())
+    tmf8805.i2c.reads.clear()
+    assert uasyncio_mock.run(tmf8805.get_measurement_async()) == 1250
+    assert (0x1E, 1) not in tmf8805.i2c.reads  # REGISTER_REGISTER_CONTENTS
+
+
+def test_async_data_available_timeout_with_interrupt_pin(
+    tmf8805_instance_with_int_pin: TMF8805,
+):
+    """Test if a missing interrupt is handled as a timeout by the async measurement"""
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.DATA_AVAILABLE_TIMEOUT
+    )
+    tmf8805 = tmf8805_instance_with_int_pin
+
+    assert uasyncio_mock.run(tmf8805.initialize_async())
+    tmf8805.i2c.reads.clear()
+    assert not uasyncio_mock.run(tmf8805.get_measurement_async())
+    assert (0x1E, 1) not in tmf8805.i2c.reads  # REGISTER_REGISTER_CONTENTS
+
+
+def test_execution_of_async_measurement(tmf8805_instance: TMF8805):
+    """Test if performing a measurement with the uasyncio api is working"""
+
+    assert uasyncio_mock.run(tmf8805_instance.initialize_async())
+    distance: int = uasyncio_mock.run(tmf8805_instance.get_measurement_async())
+    assert distance == 1250
+
+
+def test_async_cpu_ready_timed_out(tmf8805_instance: TMF8805):
+    """Test return from the async initialization if the cpu ready wait timed out"""
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.CPU_READY_TIMEOUT
+    )
+
+    assert not uasyncio_mock.run(tmf8805_instance.initialize_async())
+
+
+def test_async_data_available_timeout(tmf8805_instance: TMF8805):
+    """Test if the async measurement handles the data available timeout"""
+
+    machine_mock.TMF8805_MOCK_CONFIGURATION = (
+        machine_mock.TMF8805MockConfiguration.DATA_AVAILABLE_TIMEOUT
+    )
+
+    assert uasyncio_mock.run(tmf8805_instance.initialize_async())
+    assert not uasyncio_mock.run(tmf8805_instance.get_measurement_async())
@@ -0,0 +1,29 @@
+"""Mocked module for the uasyncio library of micropython"""
+
+import asyncio
+
+from tests import utime_mock
+
+
+async def sleep_ms(ms: int) -> None:
+    """Mocked sleep_ms coroutine that advances the simulated tick counter of utime
+
+    Args:
+        ms (int): Sleep time in milliseconds
+    """
+
+    utime_mock.sleep_ms(ms)
+    await asyncio.sleep(0)
+
+
+def run(coro):
+    """Runs the given coroutine till it is finished
+
+    Args:
+        coro: Coroutine that should be executed
+
+    Returns:
+        Return value of the coroutine
+    """
+
+    return asyncio.run(coro)
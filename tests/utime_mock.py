@@ -2,15 +2,44 @@
 
 import time as python_time
 
+# Simulated millisecond counter that only advances when sleep_ms is called, so that
+# timeouts based on ticks_ms expire without actually waiting
+_ticks_ms: int = 0
+
 
 def sleep_ms(ms: int) -> None:
-    """Mocked sleep_ms method
+    """Mocked sleep_ms method that advances the simulated tick counter
 
     Args:
         ms (int): Sleep time in milliseconds
     """
 
-    pass
+    global _ticks_ms
+    _ticks_ms += ms
+
+
+def ticks_ms() -> int:
+    """Returns the simulated millisecond counter
+
+    Returns:
+        int: Milliseconds since start of the simulated counter
+    """
+
+    return _ticks_ms
+
+
+def ticks_diff(ticks1: int, ticks2: int) -> int:
+    """Returns the difference between two tick values
+
+    Args:
+        ticks1 (int): Later tick value
+        ticks2 (int): Earlier tick value
+
+    Returns:
+        int: Difference in milliseconds
+    """
+
+    return ticks1 - ticks2
 
 
 def time() -> int:
@@ -1,127 +1,121 @@
 """Library for the tmf8805 sensor"""
 
-import sys
-
+import uasyncio
 import utime
 from machine import I2C, WDT, Pin
 
 # Constants definitions
-DEFAULT_I2C_ADDR = "0x41"
-CPU_READY_TIMEOUT = 200
-APPLICATION_READY_TIMEOUT = 500
-DATA_AVAILABLE_TIMEOUT = 500
-CHIP_ID_NUMBER = "0x07"
-APPLICATION = "0xc0"
-BOOTLOADER = "0x80"
-COMMAND_CALIBRATION = "0x0b"
-COMMAND_FACTORY_CALIBRATION = "0x0a"
-COMMAND_MEASURE = "0x02"
-COMMAND_RESULT = "0x55"
-COMMAND_SERIAL = "0x47"
-COMMAND_STOP = "0xff"
-INTERRUPT_MASK = "0x01"
-CONTENT_CALIBRATION = "0x0a"
+DEFAULT_I2C_ADDR = 0x41
+CPU_READY_TIMEOUT_MS = 20000
+APPLICATION_READY_TIMEOUT_MS = 50000
+DATA_AVAILABLE_TIMEOUT_MS = 5000
+POLL_INTERVAL_MS = 1
+# Polling REGISTER_REGISTER_CONTENTS uses the bus while the sensor is ranging, so it is
+# done less often than the other polls
+DATA_POLL_INTERVAL_MS = 10
+CHIP_ID_NUMBER = 0x07
+APPLICATION = 0xC0
+BOOTLOADER = 0x80
+COMMAND_CALIBRATION = 0x0B
+COMMAND_FACTORY_CALIBRATION = 0x0A
+COMMAND_MEASURE = 0x02
+COMMAND_RESULT = 0x55
+COMMAND_SERIAL = 0x47
+COMMAND_STOP = 0xFF
+INTERRUPT_MASK = 0x01
+CONTENT_CALIBRATION = 0x0A
 
 # Values below were taken from AN000597, pp 22
-ALGO_STATE = [
-    "0xB1",
-    "0xA9",
-    "0x02",
-    "0x00",
-    "0x00",
-    "0x00",
-    "0x00",
-    "0x00",
-    "0x00",
-    "0x00",
-    "0x00",
-]
+ALGO_STATE_BYTES = bytes(
+    [0xB1, 0xA9, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
+)
 
 # Error constants
-ERROR_NONE = "0x00"
-ERROR_I2C_COMM_ERROR = "0x01"
-ERROR_CPU_RESET_TIMEOUT = "0x02"
-ERROR_WRONG_CHIP_ID = "0x03"
-ERROR_CPU_LOAD_APPLICATION_ERROR = "0x04"
-ERROR_FACTORY_CALIBRATION_ERROR = "0x05"
+ERROR_NONE = 0x00
+ERROR_I2C_COMM_ERROR = 0x01
+ERROR_CPU_RESET_TIMEOUT = 0x02
+ERROR_WRONG_CHIP_ID = 0x03
+ERROR_CPU_LOAD_APPLICATION_ERROR = 0x04
+ERROR_FACTORY_CALIBRATION_ERROR = 0x05
 
 # GPIO mode
-MODE_INPUT = "0x00"
-MODE_LOW_INPUT = "0x01"
-MODE_HIGH_INPUT = "0x02"
-MODE_VCSEL = "0x03"
-MODE_LOW_OUTPUT = "0x04"
-MODE_HIGH_OUTPUT = "0x05"
+MODE_INPUT = 0x00
+MODE_LOW_INPUT = 0x01
+MODE_HIGH_INPUT = 0x02
+MODE_VCSEL = 0x03
+MODE_LOW_OUTPUT = 0x04
+MODE_HIGH_OUTPUT = 0x05
 
 # COMMAND constants
-CMD_DATA_7 = "0x00"
-CMD_DATA_6 = "0x01"
-CMD_DATA_5 = "0x02"
-CMD_DATA_4 = "0x03"
-CMD_DATA_3 = "0x04"
-CMD_DATA_2 = "0x05"
-CMD_DATA_1 = "0x06"
-CMD_DATA_0 = "0x07"
+CMD_DATA_7 = 0x00
+CMD_DATA_6 = 0x01
+CMD_DATA_5 = 0x02
+CMD_DATA_4 = 0x03
+CMD_DATA_3 = 0x04
+CMD_DATA_2 = 0x05
+CMD_DATA_1 = 0x06
+CMD_DATA_0 = 0x07
 
 # CPU status
-CPU_RESET = "0x07"
-CPU_READY = "0x06"
+CPU_RESET = 0x07
+CPU_READY = 0x06
+_CPU_READY_MASK = 1 << CPU_READY
 
 # Registers definitions
-REGISTER_APPID = "0x00"
-REGISTER_APPREQID = "0x02"
-REGISTER_APPREV_MAJOR = "0x01"
-REGISTER_APPREV_MINOR = "0x12"
-REGISTER_APPREV_PATCH = "0x13"
-REGISTER_CMD_DATA9 = "0x06"
-REGISTER_CMD_DATA8 = "0x07"
-REGISTER_CMD_DATA7 = "0x08"
-REGISTER_CMD_DATA6 = "0x09"
-REGISTER_CMD_DATA5 = "0x0A"
-REGISTER_CMD_DATA4 = "0x0B"
-REGISTER_CMD_DATA3 = "0x0C"
-REGISTER_CMD_DATA2 = "0x0D"
-REGISTER_CMD_DATA1 = "0x0E"
-REGISTER_CMD_DATA0 = "0x0F"
-REGISTER_COMMAND = "0x10"
-REGISTER_PREVIOUS = "0x11"
-REGISTER_STATUS = "0x1D"
-REGISTER_REGISTER_CONTENTS = "0x1E"
-REGISTER_TID = "0x1F"
-REGISTER_RESULT_NUMBER = "0x20"
-REGISTER_RESULT_INFO = "0x21"
-REGISTER_DISTANCE_PEAK_0 = "0x22"
-REGISTER_DISTANCE_PEAK_1 = "0x23"
-REGISTER_SYS_CLOCK_0 = "0x24"
-REGISTER_SYS_CLOCK_1 = "0x25"
-REGISTER_SYS_CLOCK_2 = "0x26"
-REGISTER_SYS_CLOCK_3 = "0x27"
-REGISTER_STATE_DATA_0 = "0x28"
-REGISTER_STATE_DATA_1 = "0x29"
-REGISTER_STATE_DATA_2 = "0x2A"
-REGISTER_STATE_DATA_3 = "0x2B"
-REGISTER_STATE_DATA_4 = "0x2C"
-REGISTER_STATE_DATA_5 = "0x2D"
-REGISTER_STATE_DATA_6 = "0x2E"
-REGISTER_STATE_DATA_7 = "0x2F"
-REGISTER_STATE_DATA_8_XTALK_MSB = "0x30"
-REGISTER_STATE_DATA_9_XTALK_LSB = "0x31"
-REGISTER_STATE_DATA_10_TJ = "0x32"
-REGISTER_REFERENCE_HITS_0 = "0x33"
-REGISTER_REFERENCE_HITS_1 = "0x34"
-REGISTER_REFERENCE_HITS_2 = "0x35"
-REGISTER_REFERENCE_HITS_3 = "0x36"
-REGISTER_OBJECT_HITS_0 = "0x37"
-REGISTER_OBJECT_HITS_1 = "0x38"
-REGISTER_OBJECT_HITS_2 = "0x39"
-REGISTER_OBJECT_HITS_3 = "0x3A"
-REGISTER_FACTORY_CALIB_0 = "0x20"
-REGISTER_STATE_DATA_WR_0 = "0x2E"
-REGISTER_ENABLE_REG = "0xE0"
-REGISTER_INT_STATUS = "0xE1"
-REGISTER_INT_ENAB = "0xE2"
-REGISTER_ID = "0xE3"
-REGISTER_REVID = "0xE4"
+REGISTER_APPID = 0x00
+REGISTER_APPREQID = 0x02
+REGISTER_APPREV_MAJOR = 0x01
+REGISTER_APPREV_MINOR = 0x12
+REGISTER_APPREV_PATCH = 0x13
+REGISTER_CMD_DATA9 = 0x06
+REGISTER_CMD_DATA8 = 0x07
+REGISTER_CMD_DATA7 = 0x08
+REGISTER_CMD_DATA6 = 0x09
+REGISTER_CMD_DATA5 = 0x0A
+REGISTER_CMD_DATA4 = 0x0B
+REGISTER_CMD_DATA3 = 0x0C
+REGISTER_CMD_DATA2 = 0x0D
+REGISTER_CMD_DATA1 = 0x0E
+REGISTER_CMD_DATA0 = 0x0F
+REGISTER_COMMAND = 0x10
+REGISTER_PREVIOUS = 0x11
+REGISTER_STATUS = 0x1D
+REGISTER_REGISTER_CONTENTS = 0x1E
+REGISTER_TID = 0x1F
+REGISTER_RESULT_NUMBER = 0x20
+REGISTER_RESULT_INFO = 0x21
+REGISTER_DISTANCE_PEAK_0 = 0x22
+REGISTER_DISTANCE_PEAK_1 = 0x23
+REGISTER_SYS_CLOCK_0 = 0x24
+REGISTER_SYS_CLOCK_1 = 0x25
+REGISTER_SYS_CLOCK_2 = 0x26
+REGISTER_SYS_CLOCK_3 = 0x27
+REGISTER_STATE_DATA_0 = 0x28
+REGISTER_STATE_DATA_1 = 0x29
+REGISTER_STATE_DATA_2 = 0x2A
+REGISTER_STATE_DATA_3 = 0x2B
+REGISTER_STATE_DATA_4 = 0x2C
+REGISTER_STATE_DATA_5 = 0x2D
+REGISTER_STATE_DATA_6 = 0x2E
+REGISTER_STATE_DATA_7 = 0x2F
+REGISTER_STATE_DATA_8_XTALK_MSB = 0x30
+REGISTER_STATE_DATA_9_XTALK_LSB = 0x31
+REGISTER_STATE_DATA_10_TJ = 0x32
+REGISTER_REFERENCE_HITS_0 = 0x33
+REGISTER_REFERENCE_HITS_1 = 0x34
+REGISTER_REFERENCE_HITS_2 = 0x35
+REGISTER_REFERENCE_HITS_3 = 0x36
+REGISTER_OBJECT_HITS_0 = 0x37
+REGISTER_OBJECT_HITS_1 = 0x38
+REGISTER_OBJECT_HITS_2 = 0x39
+REGISTER_OBJECT_HITS_3 = 0x3A
+REGISTER_FACTORY_CALIB_0 = 0x20
+REGISTER_STATE_DATA_WR_0 = 0x2E
+REGISTER_ENABLE_REG = 0xE0
+REGISTER_INT_STATUS = 0xE1
+REGISTER_INT_ENAB = 0xE2
+REGISTER_ID = 0xE3
+REGISTER_REVID = 0xE4
 
 # Calibration data
 CALIBRATION_DATA_LENGTH = 14
@@ -129,6 +123,14 @@ CALIBRATION_DATA_LENGTH = 14
 # Status constants
 MISSING_FACTORY_CALIBRATION = 39
 
+# Error and description for each known status
+_STATUS_TABLE = {
+    MISSING_FACTORY_CALIBRATION: (
+        "ErrMissingFactCal",
+        "There is no (or no valid) factory calibration on the device. Using default values instead.",
+    ),
+}
+
 
 class TMF8805:
     """Implementation for the tmf8805 sensor"""
@@ -136,7 +138,7 @@ class TMF8805:
     enable: int
     sda: int
     scl: int
-    address: str
+    address: int
     debug: bool
     i2c: I2C
 
@@ -146,10 +148,11 @@ class TMF8805:
         sda: int,
         scl: int,
         wdt: WDT,
-        address: str = "0x41",
+        address: int | str = DEFAULT_I2C_ADDR,
         i2c_id: int = 0,
-        i2c_frequency: int = 100000,
+        i2c_frequency: int = 400000,
         debug: bool = False,
+        int_pin: int | None = None,
     ):
         self.enable = enable
         self.sda = sda
@@ -157,10 +160,60 @@ class TMF8805:
         self.address = address
         self.debug = debug
         self.wdt = wdt
+        self._enable_pin = Pin(enable, Pin.OUT)
+
+        # Optional GPIO wired to the INT line of the sensor. If given, the end of a
+        # measurement is signalled by an IRQ instead of polling over I2C. The INT output
+        # is open-drain and active low, so the line needs a pull-up
+        self._data_ready = False
+        self._int_pin = None
+        if int_pin is not None:
+            self._int_pin = Pin(int_pin, Pin.IN, Pin.PULL_UP)
+            self._int_pin.irq(trigger=Pin.IRQ_FALLING, handler=self._on_int)
+
+        # Scratch buffers reused for every single-byte read and write and the result burst
+        # read, so that measurements don't allocate
+        self._rx1 = bytearray(1)
+        self._tx1 = bytearray(1)
+        self._rx3 = bytearray(3)
 
         self.power_up()
         self.i2c = I2C(i2c_id, sda=Pin(sda), scl=Pin(scl), freq=i2c_frequency)
 
+    def _on_int(self, pin: Pin):
+        """IRQ handler for the INT line of the sensor
+
+        Args:
+            pin (Pin): Pin that triggered the interrupt
+        """
+
+        self._data_ready = True
+
+    @property
+    def address(self) -> int:
+        """I2C address of the sensor
+
+        Returns:
+            int: Address as an integer
+        """
+
+        return self._addr_int
+
+    @address.setter
+    def address(self, address: int | str):
+        """Sets the I2C address of the sensor. Hex strings are parsed once here so that the
+        I2C helpers don't have to
+
+        Args:
+            address (int | str): Address as an integer or hex string
+        """
+
+        if isinstance(address, str):
+            address = self.hex_to_dec(address)
+
+        self._addr_int = address
+        self._connected = False
+
     def hex_to_dec(self, hex_value: str) -> int:
         """Helper method to convert a hex string to a decimal value
 
@@ -174,93 +227,102 @@ class TMF8805:
         return int(hex_value, 0)
 
     def is_connected(self) -> bool:
-        """Scans the I2C bus and checks if the given address is found
+        """Checks if the given address is found on the I2C bus. Once the sensor was found
+        the result is cached, otherwise the bus is scanned again on every call
 
         Returns:
             bool: True if the address could be found, False otherwise
         """
 
-        devices = self.i2c.scan()
+        if not self._connected:
+            return self.rescan()
+
+        return self._connected
 
-        return self.hex_to_dec(self.address) in devices
+    def rescan(self) -> bool:
+        """Scans the I2C bus again and updates the cached result of is_connected
 
-    def read_single_byte(self, register: str) -> int:
+        Returns:
+            bool: True if the address could be found, False otherwise
+        """
+
+        self._connected = self._addr_int in self.i2c.scan()
+
+        return self._connected
+
+    def read_single_byte(self, register: int) -> int:
         """Reads a single bytes from a given register
 
         Args:
-            register (str): Register that should be read
+            register (int): Register that should be read
 
         Returns:
             int: Read value as a decimal
         """
 
-        value = self.i2c.readfrom_mem(
-            self.hex_to_dec(self.address), self.hex_to_dec(register), 1
-        )
+        rx1 = self._rx1
+        self.i2c.readfrom_mem_into(self._addr_int, register, rx1)
 
-        return int.from_bytes(value, sys.byteorder)
+        return rx1[0]
 
-    def read_bytes(self, register: str, byte_count: int) -> bytes:
+    def read_bytes(self, register: int, byte_count: int) -> bytes:
         """Reads the given count of bytes from a given register
 
         Args:
-            register (str): Register that should be read
+            register (int): Register that should be read
             byte_count (int): Count of bytes
 
         Returns:
             bytes: Read content as bytes
         """
 
-        value: bytes = self.i2c.readfrom_mem(
-            self.hex_to_dec(self.address), self.hex_to_dec(register), byte_count
-        )
+        value: bytes = self.i2c.readfrom_mem(self._addr_int, register, byte_count)
 
         return value
 
-    def write_bytes(self, register: str, value: str):
+    def write_bytes(self, register: int, value: bytes):
         """Writes the given value into a given register
 
         Args:
-            register (str): Register in which should be written
-            value (str): Value as hex string
+            register (int): Register in which should be written
+            value (bytes): Value that should be written
         """
 
-        if value.startswith("0x"):
-            value = value[2:]
+        self.i2c.writeto_mem(self._addr_int, register, value)
 
-        if len(value) == 1:
-            value = "".join(["0", value])
+    def write_byte(self, register: int, value: int):
+        """Writes a single byte into a given register
 
-        self.i2c.writeto_mem(
-            self.hex_to_dec(self.address),
-            self.hex_to_dec(register),
-            bytes.fromhex(value),
-        )
+        Args:
+            register (int): Register in which should be written
+            value (int): Value of the byte
+        """
+
+        self._tx1[0] = value & 0xFF
+        self.i2c.writeto_mem(self._addr_int, register, self._tx1)
 
-    def set_register_bit(self, register: str):
+    def set_register_bit(self, register: int):
         """Sets a 1 in a given register
 
         Args:
-            register (str): Register that should be set to 1
+            register (int): Register that should be set to 1
         """
 
-        self.i2c.writeto_mem(
-            self.hex_to_dec(self.address), self.hex_to_dec(register), b"1"
-        )
+        self.i2c.writeto_mem(self._addr_int, register, b"1")
 
-    def is_bit_set(self, register: str, position: str) -> bool:
+    def is_bit_set(self, register: int, position: int) -> bool:
         """Checks if a bit is set in a given register and position
 
         Args:
-            register (str): Register that should be checked
-            position (str): Position within the register
+            register (int): Register that should be checked
+            position (int): Position within the register
 
         Returns:
             bool: True if the bit is set, False otherwise
         """
 
-        value = int(self.read_single_byte(register))
-        mask = 1 << self.hex_to_dec(position)
+        value = self.read_single_byte(register)
+        mask = 1 << position
 
         return bool(value & mask)
 
@@ -272,20 +334,62 @@ class TMF8805:
     def is_cpu_ready(self):
         """Checks if the register that indicates if the cpu is ready for commands is set"""
 
-        counter: int = 0
-        ready: bool = False
+        i2c = self.i2c
+        addr = self._addr_int
+        rx1 = self._rx1
+        feed = self.wdt.feed
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        sleep_ms = utime.sleep_ms
+        register: int = REGISTER_ENABLE_REG
+        mask: int = _CPU_READY_MASK
+        timeout: int = CPU_READY_TIMEOUT_MS
+        interval: int = POLL_INTERVAL_MS
+        start = ticks_ms()
 
-        self.wdt.feed()
-        while counter < CPU_READY_TIMEOUT and not ready:
-            ready = self.is_bit_set(REGISTER_ENABLE_REG, CPU_READY)
-            self.wdt.feed()
+        while ticks_diff(ticks_ms(), start) < timeout:
+            feed()
+            i2c.readfrom_mem_into(addr, register, rx1)
+            value = rx1[0]
 
-            if not ready:
-                counter += 1
-                utime.sleep_ms(100)
-                self.wdt.feed()
+            if value & mask:
+                return True
 
-        return ready
+            sleep_ms(interval)
+
+        return False
+
+    async def is_cpu_ready_async(self) -> bool:
+        """Same as is_cpu_ready, but yields to other uasyncio tasks while waiting
+
+        Returns:
+            bool: True if the cpu is ready, False otherwise
+        """
+
+        i2c = self.i2c
+        addr = self._addr_int
+        rx1 = self._rx1
+        feed = self.wdt.feed
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        sleep_ms = uasyncio.sleep_ms
+        register: int = REGISTER_ENABLE_REG
+        mask: int = _CPU_READY_MASK
+        timeout: int = CPU_READY_TIMEOUT_MS
+        interval: int = POLL_INTERVAL_MS
+        start = ticks_ms()
+
+        while ticks_diff(ticks_ms(), start) < timeout:
+            feed()
+            i2c.readfrom_mem_into(addr, register, rx1)
+            value = rx1[0]
+
+            if value & mask:
+                return True
+
+            await sleep_ms(interval)
+
+        return False
 
     def get_status(self) -> tuple[str, str]:
         """Returns the current status of the sensor
@@ -295,14 +399,12 @@ class TMF8805:
         """
 
         status = self.read_single_byte(REGISTER_STATUS)
+        entry = _STATUS_TABLE.get(status)
 
-        if status == MISSING_FACTORY_CALIBRATION:
-            return (
-                "ErrMissingFactCal",
-                "There is no (or no valid) factory calibration on the device. Using default values instead.",
-            )
+        if entry is not None:
+            return entry
 
-        return f"{status}", "N/A"
+        return str(status), "N/A"
 
     def get_current_calibration(self) -> bytes:
         calibration: bytes = self.read_bytes(
@@ -316,43 +418,69 @@ class TMF8805:
 
         self.wdt.feed()
         self.enable_interrupt()
-        self.write_bytes(REGISTER_COMMAND, COMMAND_FACTORY_CALIBRATION)
-
-        start_of_calibration = utime.time()
-
-        while (utime.time() - start_of_calibration) < 30:
-            self.wdt.feed()
-            utime.sleep_ms(50)
-            value = self.read_single_byte(REGISTER_REGISTER_CONTENTS)
-            print(f"REGISTER_REGISTER_CONTENTS: {value}")
-
-            if value == self.hex_to_dec(CONTENT_CALIBRATION):
-                self.wdt.feed()
-                utime.sleep_ms(10)
+        self.write_byte(REGISTER_COMMAND, COMMAND_FACTORY_CALIBRATION)
+
+        i2c = self.i2c
+        addr = self._addr_int
+        rx1 = self._rx1
+        feed = self.wdt.feed
+        time = utime.time
+        sleep_ms = utime.sleep_ms
+        register: int = REGISTER_REGISTER_CONTENTS
+        target: int = CONTENT_CALIBRATION
+        value: int = 0
+        start_of_calibration = time()
+
+        while (time() - start_of_calibration) < 30:
+            feed()
+            sleep_ms(50)
+            i2c.readfrom_mem_into(addr, register, rx1)
+            value = rx1[0]
+
+            if value == target:
+                sleep_ms(10)
                 calibration_data = self.read_bytes(
                     REGISTER_FACTORY_CALIB_0, CALIBRATION_DATA_LENGTH
                 )
                 break
 
+        if self.debug:
+            print(
+                "[TMF8805] Calibration: REGISTER_REGISTER_CONTENTS: %d after %ds"
+                % (value, utime.time() - start_of_calibration)
+            )
+
         return calibration_data
 
-    def set_calibration(self, calibration_data: bytes):
-        self.write_bytes(REGISTER_COMMAND, COMMAND_CALIBRATION)
-        self.i2c.writeto_mem(
-            self.hex_to_dec(self.address),
-            self.hex_to_dec(REGISTER_FACTORY_CALIB_0),
-            calibration_data,
-        )
-        self.write_bytes(
-            REGISTER_STATE_DATA_WR_0, "".join(entry[2:] for entry in ALGO_STATE)
-        )
+    def set_calibration(self, calibration_data: bytes) -> bool:
+        """Writes the given factory calibration and the algorithm state to the sensor
+
+        Args:
+            calibration_data (bytes): Calibration as returned by perform_calibration
+
+        Returns:
+            bool: True if the calibration was written, False if it has the wrong length
+        """
+
+        if len(calibration_data) != CALIBRATION_DATA_LENGTH:
+            print(
+                f"[TMF8805.Error] Calibration data has to be {CALIBRATION_DATA_LENGTH} bytes long"
+            )
+            return False
+
+        self.write_byte(REGISTER_COMMAND, COMMAND_CALIBRATION)
+        # REGISTER_STATE_DATA_WR_0 directly follows the calibration registers, so both
+        # are written with one burst
+        self.write_bytes(REGISTER_FACTORY_CALIB_0, calibration_data + ALGO_STATE_BYTES)
+
+        return True
 
     def load_measurement_application(self):
         """Sets the values in the register that is responsible for the current loaded application
         to the application to start a measurement
         """
 
-        self.write_bytes(REGISTER_APPREQID, APPLICATION)
+        self.write_byte(REGISTER_APPREQID, APPLICATION)
 
     def is_application_ready(self) -> bool:
         """Checks if the current loaded application is ready for execution
@@ -361,26 +489,65 @@ class TMF8805:
             bool: True if the application is ready, False otherwise
         """
 
-        counter: int = 0
+        i2c = self.i2c
+        addr = self._addr_int
+        rx1 = self._rx1
+        feed = self.wdt.feed
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        sleep_ms = utime.sleep_ms
+        register: int = REGISTER_APPID
+        target: int = APPLICATION
+        timeout: int = APPLICATION_READY_TIMEOUT_MS
+        interval: int = POLL_INTERVAL_MS
         ready: bool = False
+        start = ticks_ms()
 
-        while counter < APPLICATION_READY_TIMEOUT and not ready:
-            ready = self.read_single_byte(REGISTER_APPID) == self.hex_to_dec(
-                APPLICATION
-            )
-            self.wdt.feed()
+        while not ready and ticks_diff(ticks_ms(), start) < timeout:
+            feed()
+            i2c.readfrom_mem_into(addr, register, rx1)
+            ready = rx1[0] == target
+
+            if not ready:
+                sleep_ms(interval)
+
+        return ready
+
+    async def is_application_ready_async(self) -> bool:
+        """Same as is_application_ready, but yields to other uasyncio tasks while waiting
+
+        Returns:
+            bool: True if the application is ready, False otherwise
+        """
+
+        i2c = self.i2c
+        addr = self._addr_int
+        rx1 = self._rx1
+        feed = self.wdt.feed
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        sleep_ms = uasyncio.sleep_ms
+        register: int = REGISTER_APPID
+        target: int = APPLICATION
+        timeout: int = APPLICATION_READY_TIMEOUT_MS
+        interval: int = POLL_INTERVAL_MS
+        ready: bool = False
+        start = ticks_ms()
+
+        while not ready and ticks_diff(ticks_ms(), start) < timeout:
+            feed()
+            i2c.readfrom_mem_into(addr, register, rx1)
+            ready = rx1[0] == target
 
             if not ready:
-                counter += 1
-                utime.sleep_ms(100)
-                self.wdt.feed()
+                await sleep_ms(interval)
 
         return ready
 
     def start_measurement_application(self):
         """Sets the register to start the measurement application"""
 
-        self.write_bytes(REGISTER_COMMAND, COMMAND_MEASURE)
+        self.write_byte(REGISTER_COMMAND, COMMAND_MEASURE)
 
     def is_data_available(self) -> bool:
         """Checks if the data register contains values that could be read
@@ -389,46 +556,103 @@ class TMF8805:
             bool: True if data is available, False otherwise
         """
 
-        counter: int = 0
+        i2c = self.i2c
+        addr = self._addr_int
+        rx1 = self._rx1
+        feed = self.wdt.feed
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        sleep_ms = utime.sleep_ms
+        timeout: int = DATA_AVAILABLE_TIMEOUT_MS
+        start = ticks_ms()
+
+        if self._int_pin is not None:
+            interval: int = POLL_INTERVAL_MS
+
+            # _data_ready is set by the IRQ handler, so it has to be read from self
+            while not self._data_ready and ticks_diff(ticks_ms(), start) < timeout:
+                feed()
+                sleep_ms(interval)
+
+            return self._data_ready
+
+        register: int = REGISTER_REGISTER_CONTENTS
+        target: int = COMMAND_RESULT
+        interval = DATA_POLL_INTERVAL_MS
+        data_available: bool = False
+
+        while not data_available and ticks_diff(ticks_ms(), start) < timeout:
+            feed()
+            i2c.readfrom_mem_into(addr, register, rx1)
+            data_available = rx1[0] == target
+
+            if not data_available:
+                sleep_ms(interval)
+
+        return data_available
+
+    async def is_data_available_async(self) -> bool:
+        """Same as is_data_available, but yields to other uasyncio tasks while waiting
+
+        Returns:
+            bool: True if data is available, False otherwise
+        """
+
+        i2c = self.i2c
+        addr = self._addr_int
+        rx1 = self._rx1
+        feed = self.wdt.feed
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        sleep_ms = uasyncio.sleep_ms
+        timeout: int = DATA_AVAILABLE_TIMEOUT_MS
+        start = ticks_ms()
+
+        if self._int_pin is not None:
+            interval: int = POLL_INTERVAL_MS
+
+            # _data_ready is set by the IRQ handler, so it has to be read from self
+            while not self._data_ready and ticks_diff(ticks_ms(), start) < timeout:
+                feed()
+                await sleep_ms(interval)
+
+            return self._data_ready
+
+        register: int = REGISTER_REGISTER_CONTENTS
+        target: int = COMMAND_RESULT
+        interval = DATA_POLL_INTERVAL_MS
         data_available: bool = False
 
-        while counter < DATA_AVAILABLE_TIMEOUT and not data_available:
-            self.wdt.feed()
-            result = self.read_single_byte(REGISTER_REGISTER_CONTENTS)
-            data_available = result == int(COMMAND_RESULT, 0)
+        while not data_available and ticks_diff(ticks_ms(), start) < timeout:
+            feed()
+            i2c.readfrom_mem_into(addr, register, rx1)
+            data_available = rx1[0] == target
 
             if not data_available:
-                counter += 1
-                utime.sleep_ms(10)
-                self.wdt.feed()
+                await sleep_ms(interval)
 
         return data_available
 
     def clear_interrupt_flag(self):
         """Clears the register that is responsible for the interrupt"""
 
-        value = self.read_single_byte(REGISTER_INT_STATUS)
-        value = value | int(INTERRUPT_MASK, 0)
-        self.write_bytes(REGISTER_INT_STATUS, str(value))
+        # The bits of INT_STATUS are write-1-to-clear, so no read is needed
+        self.write_byte(REGISTER_INT_STATUS, INTERRUPT_MASK)
 
     def enable_interrupt(self):
         """Enables the interrupt of the sensor"""
 
-        value = self.read_single_byte(REGISTER_INT_STATUS)
-        value = value | int(INTERRUPT_MASK, 0)
-        self.write_bytes(REGISTER_INT_ENAB, str(value))
+        self.write_byte(REGISTER_INT_ENAB, INTERRUPT_MASK)
 
     def power_down(self):
         """Powers down the sensor"""
 
-        enable_pin = Pin(self.enable, mode=Pin.OUT)
-        enable_pin.low()
+        self._enable_pin.low()
 
     def power_up(self):
         """Powers up the sensor"""
 
-        enable_pin = Pin(self.enable, mode=Pin.OUT)
-        enable_pin.high()
+        self._enable_pin.high()
         self.wdt.feed()
 
     def initialize(self) -> bool:
@@ -450,6 +674,66 @@ class TMF8805:
 
         return True
 
+    async def initialize_async(self) -> bool:
+        """Same as initialize, but yields to other uasyncio tasks while waiting for the cpu
+
+        Returns:
+            bool: True if initialization was successful, False otherwise
+        """
+
+        if not self.is_connected():
+            print("TMF8805 is not connected. Please check the parameters")
+            return False
+
+        self.reset_cpu()
+
+        if not await self.is_cpu_ready_async():
+            print("Waiting for CPU to be ready timed out")
+            return False
+
+        return True
+
+    def _start_measurement(self):
+        """Enables the interrupt and starts the measurement application"""
+
+        self.enable_interrupt()
+
+        if self._int_pin is not None:
+            # Release the INT line from a previous result so the next one causes an edge
+            self.clear_interrupt_flag()
+            self._data_ready = False
+
+        self.start_measurement_application()
+
+    def _read_distance(self) -> int:
+        """Reads and decodes the result of a finished measurement
+
+        Returns:
+            int: Measured distance in mm
+        """
+
+        self.wdt.feed()
+        # RESULT_INFO, DISTANCE_PEAK_0 and DISTANCE_PEAK_1 are consecutive registers, so
+        # they are fetched with one burst read instead of three transactions
+        result = self._rx3
+        self.i2c.readfrom_mem_into(self._addr_int, REGISTER_RESULT_INFO, result)
+        result_info = result[0]
+        peak_0 = result[1]
+        peak_1 = result[2]
+
+        # Bits 5:0 of RESULT_INFO hold the reliability, bits 7:6 the measurement status
+        reliabilty = result_info & 0x3F
+        status = (result_info >> 6) & 0x03
+        distance = (peak_1 << 8) | peak_0
+
+        if self.debug:
+            print(
+                "[TMF8805] Measurement: %dmm (Reliabilty: %d; Status: %d; Peak1: %d; Peak0: %d)"
+                % (distance, reliabilty, status, peak_1, peak_0)
+            )
+
+        return distance
+
     def get_measurement(self) -> int:
         """Loads the application to start a measurement. Wait till the application is ready. Executes the
         measurement application. Waits till data is available. Returns the read data.
@@ -464,33 +748,32 @@ class TMF8805:
             print("Waiting for measurement application to be ready timed out")
             return False
 
-        self.start_measurement_application()
-        self.enable_interrupt()
+        self._start_measurement()
 
         if not self.is_data_available():
             print("[TMF8805.Error] Waiting for data to be available timed out")
             return False
 
-        self.wdt.feed()
-        result_info = bin(self.read_single_byte(REGISTER_RESULT_INFO))
-        result_info = result_info[2:]
-        result_info = "".join(reversed(result_info))
-        result_info = (lambda s, n, c: s + c * (n - len(s)))(result_info, 8, "0")
-        reliabilty = int(result_info[:6], 2)
-        status = int(result_info[6:8], 2)
-        self.wdt.feed()
+        return self._read_distance()
 
-        peak_1 = self.read_single_byte(REGISTER_DISTANCE_PEAK_1)
-        peak_0 = self.read_single_byte(REGISTER_DISTANCE_PEAK_0)
+    async def get_measurement_async(self) -> int:
+        """Same as get_measurement, but yields to other uasyncio tasks while waiting for the
+        application and the data
 
-        distance = peak_1
-        distance = distance << 8
-        distance += peak_0
-        self.wdt.feed()
+        Returns:
+            int: Measured distance in mm
+        """
 
-        if self.debug:
-            print(
-                f"[TMF8805] Measurement: {distance}mm (Reliabilty: {reliabilty}; Status: {status}; Peak1: {peak_1}; Peak0: {peak_0})"
-            )
+        self.load_measurement_application()
 
-        return distance
+        if not await self.is_application_ready_async():
+            print("Waiting for measurement application to be ready timed out")
+            return False
+
+        self._start_measurement()
+
+        if not await self.is_data_available_async():
+            print("[TMF8805.Error] Waiting for data to be available timed out")
+            return False
+
+        return self._read_distance()